@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Pre-serialized example profiles written by the example-* CLI commands
+
+The byte literals below are generated from the Pydantic models; regenerate them
+after changing the example data or the models with:
+
+    python -m job_search._example_profile
+"""
+
+EXAMPLE_PROFILE_JSON = (
+    b"{\n"
+    b'  "user_profile": {\n'
+    b'    "name": "Jane Smith",\n'
+    b'    "email": "jane.smith@email.com",\n'
+    b'    "phone": "+1-555-0123",\n'
+    b'    "location": "San Francisco, CA",\n'
+    b'    "linkedin": "linkedin.com/in/janesmith",\n'
+    b'    "skills": [\n'
+    b'      "Python",\n'
+    b'      "React",\n'
+    b'      "Node.js",\n'
+    b'      "AWS",\n'
+    b'      "Docker",\n'
+    b'      "Kubernetes"\n'
+    b"    ],\n"
+    b'    "experience": [\n'
+    b"      {\n"
+    b'        "title": "Senior Full Stack Developer",\n'
+    b'        "company": "Tech Innovations Inc",\n'
+    b'        "duration": "2021-2024",\n'
+    b'        "description": "Led development of scalable web applications using React and Node.js, deployed on AWS infrastructure",\n'
+    b'        "projects": []\n'
+    b"      },\n"
+    b"      {\n"
+    b'        "title": "Software Developer",\n'
+    b'        "company": "StartupCorp",\n'
+    b'        "duration": "2019-2021",\n'
+    b'        "description": "Developed RESTful APIs and frontend interfaces for customer-facing applications",\n'
+    b'        "projects": []\n'
+    b"      }\n"
+    b"    ],\n"
+    b'    "education": [\n'
+    b"      {\n"
+    b'        "degree": "Bachelor of Science in Computer Science",\n'
+    b'        "school": "Stanford University",\n'
+    b'        "year": "2019"\n'
+    b"      }\n"
+    b"    ],\n"
+    b'    "certifications": [\n'
+    b'      "AWS Certified Solutions Architect",\n'
+    b'      "React Developer Certification"\n'
+    b"    ],\n"
+    b'    "summary": "Experienced full-stack developer with 5+ years building scalable web applications using modern technologies"\n'
+    b"  },\n"
+    b'  "job_search_params": {\n'
+    b'    "search_term": "Senior Full Stack Developer",\n'
+    b'    "location": "San Francisco",\n'
+    b'    "results_wanted": 15,\n'
+    b'    "fine_tune_search_string": "startups with good work-life balance and remote-first culture",\n'
+    b'    "is_remote": true\n'
+    b"  }\n"
+    b"}"
+)
+
+EXAMPLE_USER_PROFILE_JSON = (
+    b"{\n"
+    b'  "name": "Jane Smith",\n'
+    b'  "email": "jane.smith@email.com",\n'
+    b'  "phone": "+1-555-0123",\n'
+    b'  "location": "San Francisco, CA",\n'
+    b'  "linkedin": "linkedin.com/in/janesmith",\n'
+    b'  "skills": [\n'
+    b'    "Python",\n'
+    b'    "React",\n'
+    b'    "Node.js",\n'
+    b'    "AWS",\n'
+    b'    "Docker",\n'
+    b'    "Kubernetes"\n'
+    b"  ],\n"
+    b'  "experience": [\n'
+    b"    {\n"
+    b'      "title": "Senior Full Stack Developer",\n'
+    b'      "company": "Tech Innovations Inc",\n'
+    b'      "duration": "2021-2024",\n'
+    b'      "description": "Led development of scalable web applications using React and Node.js, deployed on AWS infrastructure",\n'
+    b'      "projects": []\n'
+    b"    },\n"
+    b"    {\n"
+    b'      "title": "Software Developer",\n'
+    b'      "company": "StartupCorp",\n'
+    b'      "duration": "2019-2021",\n'
+    b'      "description": "Developed RESTful APIs and frontend interfaces for customer-facing applications",\n'
+    b'      "projects": []\n'
+    b"    }\n"
+    b"  ],\n"
+    b'  "education": [\n'
+    b"    {\n"
+    b'      "degree": "Bachelor of Science in Computer Science",\n'
+    b'      "school": "Stanford University",\n'
+    b'      "year": "2019"\n'
+    b"    }\n"
+    b"  ],\n"
+    b'  "certifications": [\n'
+    b'    "AWS Certified Solutions Architect",\n'
+    b'    "React Developer Certification"\n'
+    b"  ],\n"
+    b'  "summary": "Experienced full-stack developer with 5+ years building scalable web applications using modern technologies"\n'
+    b"}"
+)
+
+
+def _build_example_user_profile():
+    """Build the example user profile (known valid, so validation is skipped)"""
+    from job_search.models import Education, Experience, UserProfile
+
+    return UserProfile.model_construct(
+        name="Jane Smith",
+        email="jane.smith@email.com",
+        phone="+1-555-0123",
+        location="San Francisco, CA",
+        linkedin="linkedin.com/in/janesmith",
+        skills=["Python", "React", "Node.js", "AWS", "Docker", "Kubernetes"],
+        experience=[
+            Experience.model_construct(
+                title="Senior Full Stack Developer",
+                company="Tech Innovations Inc",
+                duration="2021-2024",
+                description="Led development of scalable web applications using React and Node.js, deployed on AWS infrastructure",
+            ),
+            Experience.model_construct(
+                title="Software Developer",
+                company="StartupCorp",
+                duration="2019-2021",
+                description="Developed RESTful APIs and frontend interfaces for customer-facing applications",
+            ),
+        ],
+        education=[
+            Education.model_construct(
+                degree="Bachelor of Science in Computer Science",
+                school="Stanford University",
+                year="2019",
+            )
+        ],
+        certifications=[
+            "AWS Certified Solutions Architect",
+            "React Developer Certification",
+        ],
+        summary="Experienced full-stack developer with 5+ years building scalable web applications using modern technologies",
+    )
+
+
+def _build_example_config():
+    """Build the example profile together with its job search parameters"""
+    from job_search.models import JobSearchConfig, JobSearchParams
+
+    job_search_params = JobSearchParams.model_construct(
+        search_term="Senior Full Stack Developer",
+        location="San Francisco",
+        results_wanted=15,
+        fine_tune_search_string="startups with good work-life balance and remote-first culture",
+        is_remote=True,
+    )
+
+    return JobSearchConfig.model_construct(
+        user_profile=_build_example_user_profile(),
+        job_search_params=job_search_params,
+    )
+
+
+def _bytes_assignment(name: str, data: bytes) -> str:
+    """Render `name = (...)` with one bytes literal per JSON line"""
+    lines = [f"{name} = ("]
+    for chunk in data.splitlines(keepends=True):
+        literal = repr(chunk)
+        if '"' not in literal:
+            literal = f'b"{literal[2:-1]}"'
+        lines.append(f"    {literal}")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    import json
+    import re
+    from pathlib import Path
+
+    module_path = Path(__file__)
+    source = module_path.read_text()
+    for name, model in (
+        ("EXAMPLE_PROFILE_JSON", _build_example_config()),
+        ("EXAMPLE_USER_PROFILE_JSON", _build_example_user_profile()),
+    ):
+        data = json.dumps(model.model_dump(), indent=2, ensure_ascii=False).encode()
+        replacement = _bytes_assignment(name, data)
+        source = re.sub(
+            rf"^{name} = \(\n.*?^\)\n",
+            lambda _, r=replacement: r,
+            source,
+            count=1,
+            flags=re.MULTILINE | re.DOTALL,
+        )
+    module_path.write_text(source)
+    print(f"Regenerated {module_path}")
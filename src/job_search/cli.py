@@ -1,18 +1,120 @@
 #!/usr/bin/env python
-import json
+import hashlib
+import importlib.metadata
+import inspect
+import os
+import pickle
+from pathlib import Path
 from typing import Optional
 
 import click
+import pydantic
 from pydantic import ValidationError
 
-from job_search.flows.jod_search import run_job_search_flow
-from job_search.models import (
-    Education,
-    Experience,
-    JobSearchConfig,
-    JobSearchParams,
-    UserProfile,
+from job_search._example_profile import (
+    EXAMPLE_PROFILE_JSON,
+    EXAMPLE_USER_PROFILE_JSON,
 )
+from job_search.models import JobSearchConfig, JobSearchParams, UserProfile
+
+PROFILE_CACHE_DIR = Path.home() / ".cache" / "job_search" / "profiles"
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file as bytes"""
+    # Unbuffered binary read: one fstat-sized read() straight into bytes
+    with open(path, "rb", buffering=0) as f:
+        return f.read()
+
+
+def _models_fingerprint() -> str:
+    """Identify the profile model definitions a cached pickle was built with"""
+    # Hashing the models' source is far cheaper than generating their JSON
+    # schema, and changes whenever a field, default or validator does
+    try:
+        source = _read_bytes(inspect.getfile(JobSearchConfig))
+    except (OSError, TypeError):
+        source = importlib.metadata.version("job_search").encode()
+    return hashlib.blake2b(
+        source + pydantic.VERSION.encode(), digest_size=8
+    ).hexdigest()
+
+
+def _profile_cache_path(profile_file: str) -> Path:
+    """Cache location for a profile file, keyed on its path, mtime, size and models"""
+    path = os.path.abspath(profile_file)
+    st = os.stat(path)
+    path_key = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+    state_key = hashlib.blake2b(
+        f"{st.st_mtime_ns}:{st.st_size}:{_models_fingerprint()}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    return PROFILE_CACHE_DIR / f"{path_key}-{state_key}.pkl"
+
+
+def _prune_profile_cache(cache_path: Path) -> None:
+    """Delete superseded cache entries for the same profile path"""
+    path_key = cache_path.name.split("-", 1)[0]
+    for stale in cache_path.parent.glob(f"{path_key}-*.pkl"):
+        if stale != cache_path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def _load_job_search_config(
+    profile_file: str, read_cache: bool = True
+) -> JobSearchConfig:
+    """Load and validate a profile file, reusing the pickled config if unchanged"""
+    # The cache is always refreshed; read_cache=False only skips reusing it
+    cache_path = _profile_cache_path(profile_file)
+    if read_cache and cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                config = pickle.load(f)
+            if isinstance(config, JobSearchConfig):
+                return config
+        except Exception:
+            # Unreadable or corrupt cache entry, fall back to parsing the file
+            pass
+        # Drop the bad entry so it can't break later runs if parsing fails
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+
+    # Parse and validate in a single pass inside pydantic-core
+    config = JobSearchConfig.model_validate_json(_read_bytes(profile_file))
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        _prune_profile_cache(cache_path)
+    except OSError:
+        pass
+
+    return config
+
+
+def _echo_validation_error(e: ValidationError) -> None:
+    """Report a profile ValidationError, keeping malformed JSON distinct"""
+    errors = e.errors(include_url=False, include_context=False, include_input=False)
+    if errors[0]["type"] == "json_invalid":
+        # Malformed JSON is reported alone and has no field location
+        message = errors[0]["msg"].removeprefix("Invalid JSON: ")
+        click.echo(f"Error parsing JSON file: {message}", err=True)
+        return
+
+    click.echo("Validation error in profile file:", err=True)
+    for error in errors:
+        click.echo(
+            f"  - {'.'.join(map(str, error['loc']))}: {error['msg']}",
+            err=True,
+        )
 
 
 @click.group()
@@ -23,7 +125,12 @@ def cli():
 
 @cli.command()
 @click.option("-p", "--profile-file", required=True, type=click.Path(exists=True))
-def run(profile_file: str):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-parse the profile file and refresh its cache entry",
+)
+def run(profile_file: str, no_cache: bool):
     # Generate detailed docs
     """
     Run Job Search Flow using a JSON profile file
@@ -47,43 +154,31 @@ def run(profile_file: str):
         }
     }
     """
-    try:
-        with open(profile_file, "r") as f:
-            config_data = json.load(f)
-
-        # Validate using Pydantic models
-        config = JobSearchConfig(**config_data)
+    from job_search.flows.jod_search import run_job_search_flow
 
-        # Convert to dict for flow compatibility
-        user_profile = config.user_profile.model_dump()
-        job_search_params = config.job_search_params.model_dump()
-
-        click.echo("🚀 Starting Job Search Flow")
-        click.echo(f"User: {config.user_profile.name} ({config.user_profile.email})")
-        click.echo(
-            f"Search: {config.job_search_params.search_term} in {config.job_search_params.location}"
-        )
-        click.echo(
-            f"Remote only: {'Yes' if config.job_search_params.is_remote else 'No'}"
-        )
-        if config.job_search_params.fine_tune_search_string:
-            click.echo(
-                f"Fine-tune criteria: {config.job_search_params.fine_tune_search_string}"
+    try:
+        config = _load_job_search_config(profile_file, read_cache=not no_cache)
+
+        user_profile = config.user_profile
+        job_search_params = config.job_search_params
+        lines = [
+            "🚀 Starting Job Search Flow",
+            f"User: {user_profile.name} ({user_profile.email})",
+            f"Search: {job_search_params.search_term} in {job_search_params.location}",
+            f"Remote only: {'Yes' if job_search_params.is_remote else 'No'}",
+        ]
+        if job_search_params.fine_tune_search_string:
+            lines.append(
+                f"Fine-tune criteria: {job_search_params.fine_tune_search_string}"
             )
+        click.echo("\n".join(lines))
 
         result = run_job_search_flow(user_profile, job_search_params)
         click.echo("✅ Job Search Flow completed successfully")
         return result
 
     except ValidationError as e:
-        click.echo("Validation error in profile file:", err=True)
-        for error in e.errors():
-            click.echo(
-                f"  - {'.'.join(str(x) for x in error['loc'])}: {error['msg']}",
-                err=True,
-            )
-    except json.JSONDecodeError as e:
-        click.echo(f"Error parsing JSON file: {e}", err=True)
+        _echo_validation_error(e)
     except Exception as e:
         click.echo(f"Error running job search: {e}", err=True)
 
@@ -126,45 +221,39 @@ def run_with_params(
         "education": [...]
     }
     """
+    from job_search.flows.jod_search import run_job_search_flow
+
     try:
-        with open(profile_file, "r") as f:
-            profile_data = json.load(f)
-
-        # Validate using Pydantic models
-        user_profile = UserProfile(**profile_data)
-        job_search_params = JobSearchParams(
-            search_term=search_term,
-            location=location,
-            results_wanted=results_wanted,
-            fine_tune_search_string=fine_tune,
-            is_remote=is_remote,
+        # Parse and validate in a single pass inside pydantic-core
+        user_profile = UserProfile.model_validate_json(_read_bytes(profile_file))
+
+        job_search_params = JobSearchParams.model_validate(
+            {
+                "search_term": search_term,
+                "location": location,
+                "results_wanted": results_wanted,
+                "fine_tune_search_string": fine_tune,
+                "is_remote": is_remote,
+            }
         )
 
-        # Convert to dict for flow compatibility
-        user_profile_dict = user_profile.model_dump()
-        job_search_params_dict = job_search_params.model_dump()
-
-        click.echo("🚀 Starting Job Search Flow")
-        click.echo(f"User: {user_profile.name} ({user_profile.email})")
-        click.echo(f"Search: {search_term} in {location}")
-        click.echo(f"Results wanted: {results_wanted}")
-        click.echo(f"Remote only: {'Yes' if is_remote else 'No'}")
+        lines = [
+            "🚀 Starting Job Search Flow",
+            f"User: {user_profile.name} ({user_profile.email})",
+            f"Search: {search_term} in {location}",
+            f"Results wanted: {results_wanted}",
+            f"Remote only: {'Yes' if is_remote else 'No'}",
+        ]
         if fine_tune:
-            click.echo(f"Fine-tune criteria: {fine_tune}")
+            lines.append(f"Fine-tune criteria: {fine_tune}")
+        click.echo("\n".join(lines))
 
-        result = run_job_search_flow(user_profile_dict, job_search_params_dict)
+        result = run_job_search_flow(user_profile, job_search_params)
         click.echo("✅ Job Search Flow completed successfully")
         return result
 
     except ValidationError as e:
-        click.echo("Validation error in profile file:", err=True)
-        for error in e.errors():
-            click.echo(
-                f"  - {'.'.join(str(x) for x in error['loc'])}: {error['msg']}",
-                err=True,
-            )
-    except json.JSONDecodeError as e:
-        click.echo(f"Error parsing JSON file: {e}", err=True)
+        _echo_validation_error(e)
     except Exception as e:
         click.echo(f"Error running job search: {e}", err=True)
 
@@ -178,57 +267,9 @@ def run_with_params(
 def example_profile(filename: str):
     """Generate an example profile JSON file"""
 
-    # Create example using Pydantic models for validation
-    user_profile = UserProfile(
-        name="Jane Smith",
-        email="jane.smith@email.com",
-        phone="+1-555-0123",
-        location="San Francisco, CA",
-        linkedin="linkedin.com/in/janesmith",
-        skills=["Python", "React", "Node.js", "AWS", "Docker", "Kubernetes"],
-        experience=[
-            Experience(
-                title="Senior Full Stack Developer",
-                company="Tech Innovations Inc",
-                duration="2021-2024",
-                description="Led development of scalable web applications using React and Node.js, deployed on AWS infrastructure",
-            ),
-            Experience(
-                title="Software Developer",
-                company="StartupCorp",
-                duration="2019-2021",
-                description="Developed RESTful APIs and frontend interfaces for customer-facing applications",
-            ),
-        ],
-        education=[
-            Education(
-                degree="Bachelor of Science in Computer Science",
-                school="Stanford University",
-                year="2019",
-            )
-        ],
-        certifications=[
-            "AWS Certified Solutions Architect",
-            "React Developer Certification",
-        ],
-        summary="Experienced full-stack developer with 5+ years building scalable web applications using modern technologies",
-    )
-
-    job_search_params = JobSearchParams(
-        search_term="Senior Full Stack Developer",
-        location="San Francisco",
-        results_wanted=15,
-        fine_tune_search_string="startups with good work-life balance and remote-first culture",
-        is_remote=True,
-    )
-
-    config = JobSearchConfig(
-        user_profile=user_profile, job_search_params=job_search_params
-    )
-
-    # Export to JSON
-    with open(filename, "w") as f:
-        json.dump(config.model_dump(), f, indent=2)
+    # Pre-serialized JSON, see job_search._example_profile
+    with open(filename, "wb") as f:
+        f.write(EXAMPLE_PROFILE_JSON)
 
     click.echo(f"Example profile saved to {filename}")
     click.echo(f"You can now run: job-search-cli job-search {filename}")
@@ -243,45 +284,9 @@ def example_profile(filename: str):
 def example_user_profile(filename: str):
     """Generate an example user profile JSON file (profile only, no search params)"""
 
-    # Create example using Pydantic models for validation
-    user_profile = UserProfile(
-        name="Jane Smith",
-        email="jane.smith@email.com",
-        phone="+1-555-0123",
-        location="San Francisco, CA",
-        linkedin="linkedin.com/in/janesmith",
-        skills=["Python", "React", "Node.js", "AWS", "Docker", "Kubernetes"],
-        experience=[
-            Experience(
-                title="Senior Full Stack Developer",
-                company="Tech Innovations Inc",
-                duration="2021-2024",
-                description="Led development of scalable web applications using React and Node.js, deployed on AWS infrastructure",
-            ),
-            Experience(
-                title="Software Developer",
-                company="StartupCorp",
-                duration="2019-2021",
-                description="Developed RESTful APIs and frontend interfaces for customer-facing applications",
-            ),
-        ],
-        education=[
-            Education(
-                degree="Bachelor of Science in Computer Science",
-                school="Stanford University",
-                year="2019",
-            )
-        ],
-        certifications=[
-            "AWS Certified Solutions Architect",
-            "React Developer Certification",
-        ],
-        summary="Experienced full-stack developer with 5+ years building scalable web applications using modern technologies",
-    )
-
-    # Export to JSON
-    with open(filename, "w") as f:
-        json.dump(user_profile.model_dump(), f, indent=2)
+    # Pre-serialized JSON, see job_search._example_profile
+    with open(filename, "wb") as f:
+        f.write(EXAMPLE_USER_PROFILE_JSON)
 
     click.echo(f"Example user profile saved to {filename}")
     click.echo(
@@ -1,5 +1,5 @@
 from os import getenv
-from typing import List
+from typing import List, NamedTuple, Optional
 
 from crewai import LLM, Agent, Crew, Process, Task
 from crewai.agents.agent_builder.base_agent import BaseAgent
@@ -9,6 +9,20 @@ from job_search.tools.jobspy_tool import JobSpyTool
 from job_search.tools.resume_generator_tool import ResumeGeneratorTool
 
 
+class _LLMSettings(NamedTuple):
+    model: Optional[str]
+    api_key: Optional[str]
+    api_base: Optional[str]
+
+
+# Read once when the crew module is first imported
+_LLM_SETTINGS = _LLMSettings(
+    model=getenv("OPENAI_MODEL_NAME"),
+    api_key=getenv("OPENAI_API_KEY"),
+    api_base=getenv("OPENAI_API_BASE"),
+)
+
+
 @CrewBase
 class JobSearchCrew:
     """Job Search Crew for finding jobs and generating personalized resumes"""
@@ -21,9 +35,9 @@ class JobSearchCrew:
 
     def __init__(self) -> None:
         self.llm = LLM(
-            model=getenv("OPENAI_MODEL_NAME"),  # type: ignore[index]
-            api_key=getenv("OPENAI_API_KEY"),  # type: ignore[index]
-            api_base=getenv("OPENAI_API_BASE"),  # type: ignore[index]
+            model=_LLM_SETTINGS.model,  # type: ignore[arg-type]
+            api_key=_LLM_SETTINGS.api_key,
+            api_base=_LLM_SETTINGS.api_base,
         )
 
     @agent
@@ -67,12 +81,15 @@ class JobSearchCrew:
             agent=self.job_searcher(),
         )
 
+    # analyze_skills_gap and filter_jobs only depend on search_jobs, so they run
+    # concurrently; generate_resume waits for both.
     @task
     def analyze_skills_gap(self) -> Task:
         return Task(
             config=self.tasks_config["analyze_skills_gap"],  # type: ignore[index]
             agent=self.skills_analyzer(),
             context=[self.search_jobs()],
+            async_execution=True,
         )
 
     @task
@@ -81,6 +98,7 @@ class JobSearchCrew:
             config=self.tasks_config["filter_jobs"],  # type: ignore[index]
             agent=self.job_filter(),
             context=[self.search_jobs()],
+            async_execution=True,
         )
 
     @task
@@ -94,8 +112,6 @@ class JobSearchCrew:
     @crew
     def crew(self) -> Crew:
         """Creates the Job Search Crew"""
-        for a in self.agents:
-            a.llm = self.llm
         return Crew(
             agents=self.agents,
             tasks=self.tasks,
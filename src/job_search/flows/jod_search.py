@@ -1,15 +1,78 @@
 #!/usr/bin/env python
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from crewai.flow import Flow, listen, start
-from pydantic import BaseModel
-
-from job_search.crews.job_search_crew.job_search_crew import JobSearchCrew
+from pydantic import BaseModel, ConfigDict
+
+from job_search.models import JobSearchParams, UserProfile
+
+if TYPE_CHECKING:
+    from job_search.crews.job_search_crew.job_search_crew import JobSearchCrew
+
+_DEFAULT_USER_PROFILE: Dict[str, Any] = {
+    "name": "John Doe",
+    "email": "john.doe@email.com",
+    "skills": ["Python", "Machine Learning", "Data Analysis"],
+    "experience": [
+        {
+            "title": "Data Scientist",
+            "company": "Tech Corp",
+            "duration": "2022-2024",
+            "description": "Developed ML models and analyzed large datasets",
+        }
+    ],
+    "education": [
+        {
+            "degree": "Master of Science in Computer Science",
+            "school": "University of Technology",
+            "year": "2022",
+        }
+    ],
+    "summary": "Experienced data scientist with expertise in machine learning and data analysis",
+}
+
+_DEFAULT_JOB_SEARCH_PARAMS: Dict[str, Any] = {
+    "search_term": "Data Scientist",
+    "location": "Remote",
+    "results_wanted": 10,
+    "is_remote": False,
+}
+
+_SEP = "=" * 50
+
+_SUMMARY_TEMPLATE = "\n".join(
+    [
+        "\nJobSearch Flow completed successfully!",
+        "Skills analysis: Available in flow state",
+        "Resume generated: {resume_path}",
+        "\n" + _SEP,
+        "FLOW SUMMARY:",
+        _SEP,
+        "User: {name}",
+        "Search Term: {search_term}",
+        "Location: {location}",
+        "Resume Output: {resume_path}",
+        _SEP,
+    ]
+)
+
+
+def _build_crew() -> "JobSearchCrew":
+    """Fresh JobSearchCrew for one flow run"""
+    # Imported here so loading the flow module doesn't pull in the crew's tools.
+    # Not shared between runs: the Crew keeps a tool result cache and mutable
+    # task/agent state, and building one only takes a few milliseconds.
+    from job_search.crews.job_search_crew.job_search_crew import JobSearchCrew
+
+    return JobSearchCrew()
 
 
 class JobSearchState(BaseModel):
-    user_profile: Dict[str, Any] = {}
-    job_search_params: Dict[str, Any] = {}
+    # Internal flow state only ever receives already-validated values
+    model_config = ConfigDict(validate_assignment=False)
+
+    user_profile: Optional[UserProfile] = None
+    job_search_params: Optional[JobSearchParams] = None
     job_listings: str = ""
     skills_analysis: str = ""
     resume_path: str = ""
@@ -28,61 +91,33 @@ class JobSearchFlow(Flow[JobSearchState]):
         print("User profile and job search parameters ready")
 
         # The user_profile and job_search_params should be set before starting the flow
-        if not self.state.user_profile:
+        if self.state.user_profile is None:
             print("Warning: No user profile provided. Using default values.")
-            self.state.user_profile = {
-                "name": "John Doe",
-                "email": "john.doe@email.com",
-                "skills": ["Python", "Machine Learning", "Data Analysis"],
-                "experience": [
-                    {
-                        "title": "Data Scientist",
-                        "company": "Tech Corp",
-                        "duration": "2022-2024",
-                        "description": "Developed ML models and analyzed large datasets",
-                    }
-                ],
-                "education": [
-                    {
-                        "degree": "Master of Science in Computer Science",
-                        "school": "University of Technology",
-                        "year": "2022",
-                    }
-                ],
-                "summary": "Experienced data scientist with expertise in machine learning and data analysis",
-            }
+            self.state.user_profile = UserProfile.model_validate(_DEFAULT_USER_PROFILE)
 
-        if not self.state.job_search_params:
+        if self.state.job_search_params is None:
             print("Warning: No job search parameters provided. Using default values.")
-            self.state.job_search_params = {
-                "search_term": "Data Scientist",
-                "location": "Remote",
-                "results_wanted": 10,
-                "is_remote": False,
-            }
+            self.state.job_search_params = JobSearchParams.model_validate(
+                _DEFAULT_JOB_SEARCH_PARAMS
+            )
 
     @listen(collect_user_info)
     def search_and_analyze_jobs(self):
         """Search for jobs using JobSpy and analyze skill gaps"""
         print("Searching for relevant job listings...")
 
-        # Prepare inputs for the crew
+        # Prepare inputs for the crew; crew inputs must be plain data, not models.
+        # The profile is serialized to JSON once by pydantic-core, and the search
+        # parameters are also exposed as top-level template variables.
+        job_search_params = self.state.job_search_params.model_dump()
         crew_inputs = {
-            "user_profile": self.state.user_profile,
-            "job_search_params": self.state.job_search_params,
-            "search_term": self.state.job_search_params.get(
-                "search_term", "Software Developer"
-            ),
-            "location": self.state.job_search_params.get("location", ""),
-            "results_wanted": self.state.job_search_params.get("results_wanted", 10),
-            "fine_tune_search_string": self.state.job_search_params.get(
-                "fine_tune_search_string", ""
-            ),
-            "is_remote": self.state.job_search_params.get("is_remote", False),
+            "user_profile": self.state.user_profile.model_dump_json(),
+            "job_search_params": job_search_params,
+            **job_search_params,
         }
 
         # Run the job search crew
-        result = JobSearchCrew().crew().kickoff(inputs=crew_inputs)
+        result = _build_crew().crew().kickoff(inputs=crew_inputs)
 
         print("Job search and analysis completed")
         self.state.skills_analysis = result.raw
@@ -100,36 +135,34 @@ class JobSearchFlow(Flow[JobSearchState]):
     @listen(generate_personalized_resume)
     def finalize_results(self):
         """Finalize and present results"""
-        print("\nJobSearch Flow completed successfully!")
-        print("Skills analysis: Available in flow state")
-        print(f"Resume generated: {self.state.resume_path}")
-        print("\n" + "=" * 50)
-        print("FLOW SUMMARY:")
-        print("=" * 50)
-        print(f"User: {self.state.user_profile.get('name', 'N/A')}")
-        print(f"Search Term: {self.state.job_search_params.get('search_term', 'N/A')}")
-        print(f"Location: {self.state.job_search_params.get('location', 'N/A')}")
-        print(f"Resume Output: {self.state.resume_path}")
-        print("=" * 50)
+        print(
+            _SUMMARY_TEMPLATE.format(
+                resume_path=self.state.resume_path,
+                name=self.state.user_profile.name,
+                search_term=self.state.job_search_params.search_term,
+                location=self.state.job_search_params.location,
+            )
+        )
 
 
 def run_job_search_flow(
-    user_profile: Dict[str, Any] | None = None,
-    job_search_params: Dict[str, Any] | None = None,
+    user_profile: UserProfile | Dict[str, Any] | None = None,
+    job_search_params: JobSearchParams | Dict[str, Any] | None = None,
 ):
     """
     Run the JobSearch flow with user-provided parameters
 
     Args:
-        user_profile: Dictionary containing user's career information
-        job_search_params: Dictionary containing job search parameters
+        user_profile: User's career information, as a model or a dictionary
+        job_search_params: Job search parameters, as a model or a dictionary
     """
     flow = JobSearchFlow()
 
+    # Dicts are validated here; already-validated models are kept as-is
     if user_profile:
-        flow.state.user_profile = user_profile
+        flow.state.user_profile = UserProfile.model_validate(user_profile)
     if job_search_params:
-        flow.state.job_search_params = job_search_params
+        flow.state.job_search_params = JobSearchParams.model_validate(job_search_params)
 
     return flow.kickoff()
 
@@ -1,7 +1,90 @@
 #!/usr/bin/env python
-from typing import List, Optional
-
-from pydantic import BaseModel, EmailStr, Field
+"""
+Pydantic models for the user profile and job search parameters
+
+Every model sets defer_build, so importing this module (e.g. for the CLI's
+example-* commands) is cheap; validators are built on first use instead.
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Loose sanity check only; full RFC 5322 validation isn't worth its cost here
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Schema examples, kept out of the class bodies
+_USER_PROFILE_EXAMPLE = {
+    "name": "Jane Smith",
+    "email": "jane.smith@email.com",
+    "phone": "+1-555-0123",
+    "location": "San Francisco, CA",
+    "linkedin": "linkedin.com/in/janesmith",
+    "skills": ["Python", "React", "Node.js", "AWS", "Docker"],
+    "experience": [
+        {
+            "title": "Senior Full Stack Developer",
+            "company": "Tech Innovations Inc",
+            "duration": "2021-2024",
+            "description": "Led development of scalable web applications",
+            "projects": [
+                {
+                    "name": "E-commerce Platform",
+                    "description": "Built scalable e-commerce platform with React and Node.js",
+                    "technologies": [
+                        "React",
+                        "Node.js",
+                        "PostgreSQL",
+                        "AWS",
+                    ],
+                },
+                {
+                    "name": "Real-time Analytics Dashboard",
+                    "description": "Developed real-time data visualization dashboard",
+                    "technologies": [
+                        "React",
+                        "D3.js",
+                        "WebSocket",
+                        "Redis",
+                    ],
+                },
+            ],
+        }
+    ],
+    "education": [
+        {
+            "degree": "Bachelor of Science in Computer Science",
+            "school": "Stanford University",
+            "year": "2019",
+        }
+    ],
+    "certifications": ["AWS Certified Solutions Architect"],
+    "summary": "Experienced full-stack developer with 5+ years experience",
+}
+
+_JOB_SEARCH_PARAMS_EXAMPLE = {
+    "search_term": "Senior Full Stack Developer",
+    "location": "San Francisco",
+    "results_wanted": 15,
+    "fine_tune_search_string": "startups with good work-life balance and remote-first culture",
+    "is_remote": True,
+}
+
+_JOB_SEARCH_CONFIG_EXAMPLE = {
+    "user_profile": {
+        "name": "Jane Smith",
+        "email": "jane.smith@email.com",
+        "skills": ["Python", "React"],
+        "experience": [],
+        "education": [],
+    },
+    "job_search_params": {
+        "search_term": "Software Developer",
+        "location": "Remote",
+        "results_wanted": 10,
+    },
+}
 
 
 class Project(BaseModel):
@@ -13,6 +96,8 @@ class Project(BaseModel):
         default_factory=list, description="Technologies used"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class Experience(BaseModel):
     """Model for work experience entry"""
@@ -25,6 +110,18 @@ class Experience(BaseModel):
         default_factory=list, description="List of projects worked on"
     )
 
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "Experience":
+        """Build from already-validated data; see UserProfile.from_trusted"""
+        fields = dict(data)
+        fields["projects"] = [
+            p if isinstance(p, Project) else Project.model_construct(**p)
+            for p in fields.get("projects", [])
+        ]
+        return cls.model_construct(**fields)
+
 
 class Education(BaseModel):
     """Model for education entry"""
@@ -33,12 +130,14 @@ class Education(BaseModel):
     school: str = Field(..., description="Educational institution name")
     year: str = Field(..., description="Graduation year or year range")
 
+    model_config = ConfigDict(defer_build=True)
+
 
 class UserProfile(BaseModel):
     """Model for user profile containing all personal and professional information"""
 
     name: str = Field(..., description="Full name")
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., description="Email address")
     phone: Optional[str] = Field(None, description="Phone number")
     location: Optional[str] = Field(None, description="Current location")
     linkedin: Optional[str] = Field(None, description="LinkedIn profile URL")
@@ -56,56 +155,37 @@ class UserProfile(BaseModel):
     )
     summary: Optional[str] = Field(None, description="Professional summary")
 
+    @field_validator("email")
+    @classmethod
+    def _validate_email(cls, v: str) -> str:
+        """Reject values that don't look like an email address"""
+        if not _EMAIL_RE.fullmatch(v):
+            raise ValueError("value is not a valid email address")
+        return v
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "UserProfile":
+        """
+        Build from already-validated data, skipping validation
+
+        Unlike model_construct, nested experience and education entries are
+        built as models too. Never use this on untrusted input (user files, API
+        payloads); use model_validate there.
+        """
+        fields = dict(data)
+        fields["experience"] = [
+            e if isinstance(e, Experience) else Experience.from_trusted(e)
+            for e in fields.get("experience", [])
+        ]
+        fields["education"] = [
+            e if isinstance(e, Education) else Education.model_construct(**e)
+            for e in fields.get("education", [])
+        ]
+        return cls.model_construct(**fields)
+
     class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "Jane Smith",
-                "email": "jane.smith@email.com",
-                "phone": "+1-555-0123",
-                "location": "San Francisco, CA",
-                "linkedin": "linkedin.com/in/janesmith",
-                "skills": ["Python", "React", "Node.js", "AWS", "Docker"],
-                "experience": [
-                    {
-                        "title": "Senior Full Stack Developer",
-                        "company": "Tech Innovations Inc",
-                        "duration": "2021-2024",
-                        "description": "Led development of scalable web applications",
-                        "projects": [
-                            {
-                                "name": "E-commerce Platform",
-                                "description": "Built scalable e-commerce platform with React and Node.js",
-                                "technologies": [
-                                    "React",
-                                    "Node.js",
-                                    "PostgreSQL",
-                                    "AWS",
-                                ],
-                            },
-                            {
-                                "name": "Real-time Analytics Dashboard",
-                                "description": "Developed real-time data visualization dashboard",
-                                "technologies": [
-                                    "React",
-                                    "D3.js",
-                                    "WebSocket",
-                                    "Redis",
-                                ],
-                            },
-                        ],
-                    }
-                ],
-                "education": [
-                    {
-                        "degree": "Bachelor of Science in Computer Science",
-                        "school": "Stanford University",
-                        "year": "2019",
-                    }
-                ],
-                "certifications": ["AWS Certified Solutions Architect"],
-                "summary": "Experienced full-stack developer with 5+ years experience",
-            }
-        }
+        defer_build = True
+        json_schema_extra = {"example": _USER_PROFILE_EXAMPLE}
 
 
 class JobSearchParams(BaseModel):
@@ -127,15 +207,8 @@ class JobSearchParams(BaseModel):
     )
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "search_term": "Senior Full Stack Developer",
-                "location": "San Francisco",
-                "results_wanted": 15,
-                "fine_tune_search_string": "startups with good work-life balance and remote-first culture",
-                "is_remote": True,
-            }
-        }
+        defer_build = True
+        json_schema_extra = {"example": _JOB_SEARCH_PARAMS_EXAMPLE}
 
 
 class JobSearchConfig(BaseModel):
@@ -145,19 +218,5 @@ class JobSearchConfig(BaseModel):
     job_search_params: JobSearchParams
 
     class Config:
-        json_schema_extra = {
-            "example": {
-                "user_profile": {
-                    "name": "Jane Smith",
-                    "email": "jane.smith@email.com",
-                    "skills": ["Python", "React"],
-                    "experience": [],
-                    "education": [],
-                },
-                "job_search_params": {
-                    "search_term": "Software Developer",
-                    "location": "Remote",
-                    "results_wanted": 10,
-                },
-            }
-        }
+        defer_build = True
+        json_schema_extra = {"example": _JOB_SEARCH_CONFIG_EXAMPLE}
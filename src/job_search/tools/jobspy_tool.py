@@ -1,9 +1,136 @@
-from typing import List, Type
+import time
+from typing import Any, Dict, List, Tuple, Type
 
+import pandas as pd
 from crewai.tools import BaseTool
 from jobspy import scrape_jobs
 from pydantic import BaseModel, Field
 
+_JOB_COLUMNS = [
+    "title",
+    "company",
+    "location",
+    "job_url",
+    "description",
+    "min_amount",
+    "max_amount",
+    "date_posted",
+    "site",
+]
+
+_SEP = "-" * 50 + "\n\n"
+
+# Identical searches within this window reuse the previous result
+_CACHE_TTL_SECONDS = 600
+_CACHE_MAX_ENTRIES = 32
+
+# Normalized query -> (monotonic time it was stored, formatted result)
+_search_cache: Dict[Tuple[Any, ...], Tuple[float, str]] = {}
+
+
+def _search_jobs(
+    site_name: List[str],
+    search_term: str,
+    location: str,
+    results_wanted: int,
+    hours_old: int,
+    country_indeed: str,
+    is_remote: bool,
+) -> str:
+    """Scrape and format jobs, reusing a recent result for the same query"""
+    # Only the cache key is normalized, so trivially different retries share
+    # an entry; the job boards still get the caller's original query
+    key = (
+        tuple(sorted(set(site_name))),
+        search_term.strip().lower(),
+        location.strip().lower(),
+        results_wanted,
+        hours_old,
+        country_indeed,
+        is_remote,
+    )
+    now = time.monotonic()
+    cached = _search_cache.pop(key, None)
+    if cached is not None and now - cached[0] < _CACHE_TTL_SECONDS:
+        _search_cache[key] = cached
+        return cached[1]
+
+    jobs_df = scrape_jobs(
+        site_name=site_name,
+        search_term=search_term,
+        location=location,
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        country_indeed=country_indeed,
+        is_remote=is_remote,
+    )
+    result = _format_jobs(jobs_df)
+
+    # Dicts keep insertion order, so the first key is the least recently used
+    _search_cache[key] = (now, result)
+    if len(_search_cache) > _CACHE_MAX_ENTRIES:
+        _search_cache.pop(next(iter(_search_cache)))
+    return result
+
+
+def _format_jobs(jobs_df: pd.DataFrame) -> str:
+    """Render scraped jobs as the text report handed to the agent"""
+    if jobs_df.empty:
+        return "No jobs found matching the search criteria."
+
+    # Project to the columns we report and fill gaps once, up front
+    jobs = jobs_df.reindex(columns=_JOB_COLUMNS).fillna("N/A")
+
+    # Truncate long descriptions in one vectorized pass
+    description = jobs["description"].astype(str)
+    too_long = description.str.len() > 500
+    jobs["description"] = description.where(
+        ~too_long, description.str.slice(0, 500) + "..."
+    )
+
+    # Build the salary text for all rows at once
+    salary_range = (
+        "$" + jobs["min_amount"].astype(str) + " - $" + jobs["max_amount"].astype(str)
+    )
+
+    # Format output for the agent, zipping plain column arrays rather
+    # than building a row object per job
+    out = [f"Found {len(jobs)} job listings:\n\n"]
+    columns = (
+        jobs["title"].to_numpy(),
+        jobs["company"].to_numpy(),
+        jobs["location"].to_numpy(),
+        jobs["job_url"].to_numpy(),
+        jobs["description"].to_numpy(),
+        salary_range.to_numpy(),
+        jobs["date_posted"].to_numpy(),
+        jobs["site"].to_numpy(),
+    )
+    for i, (
+        title,
+        company,
+        location,
+        job_url,
+        description,
+        salary,
+        date_posted,
+        site,
+    ) in enumerate(zip(*columns), 1):
+        out.append(
+            f"Job {i}:\n"
+            f"Title: {title}\n"
+            f"Company: {company}\n"
+            f"Location: {location}\n"
+            f"Salary: {salary}\n"
+            f"Posted: {date_posted}\n"
+            f"Description: {description}\n"
+            f"URL: {job_url}\n"
+            f"Source: {site}\n"
+            f"{_SEP}"
+        )
+
+    return "".join(out)
+
 
 class JobSpyInput(BaseModel):
     site_name: List[str] = Field(
@@ -40,7 +167,7 @@ class JobSpyTool(BaseTool):
         is_remote: bool,
     ) -> str:
         try:
-            jobs_df = scrape_jobs(
+            return _search_jobs(
                 site_name=site_name,
                 search_term=search_term,
                 location=location,
@@ -50,43 +177,5 @@ class JobSpyTool(BaseTool):
                 is_remote=is_remote,
             )
 
-            if jobs_df.empty:
-                return "No jobs found matching the search criteria."
-
-            job_listings = []
-            for _, job in jobs_df.iterrows():
-                job_info = {
-                    "title": job.get("title", "N/A"),
-                    "company": job.get("company", "N/A"),
-                    "location": job.get("location", "N/A"),
-                    "job_url": job.get("job_url", "N/A"),
-                    "description": job.get("description", "N/A")[:500] + "..."
-                    if len(str(job.get("description", ""))) > 500
-                    else job.get("description", "N/A"),
-                    "salary_min": job.get("min_amount", "N/A"),
-                    "salary_max": job.get("max_amount", "N/A"),
-                    "date_posted": job.get("date_posted", "N/A"),
-                    "site": job.get("site", "N/A"),
-                }
-                job_listings.append(job_info)
-
-            # Format output for the agent
-            formatted_output = f"Found {len(job_listings)} job listings:\n\n"
-            for i, job in enumerate(job_listings, 1):
-                formatted_output += f"Job {i}:\n"
-                formatted_output += f"Title: {job['title']}\n"
-                formatted_output += f"Company: {job['company']}\n"
-                formatted_output += f"Location: {job['location']}\n"
-                formatted_output += (
-                    f"Salary: ${job['salary_min']} - ${job['salary_max']}\n"
-                )
-                formatted_output += f"Posted: {job['date_posted']}\n"
-                formatted_output += f"Description: {job['description']}\n"
-                formatted_output += f"URL: {job['job_url']}\n"
-                formatted_output += f"Source: {job['site']}\n"
-                formatted_output += "-" * 50 + "\n\n"
-
-            return formatted_output
-
         except Exception as e:
             return f"Error searching for jobs: {str(e)}"
@@ -1,4 +1,5 @@
-import os
+import io
+from functools import lru_cache
 from typing import Any, Dict, Type
 
 from crewai.tools import BaseTool
@@ -7,6 +8,33 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Inches
 from pydantic import BaseModel, Field
 
+# Contact details shown under the name, in order, with their display format
+_CONTACT_FIELDS = (
+    ("email", "{}"),
+    ("phone", "{}"),
+    ("location", "{}"),
+    ("linkedin", "LinkedIn: {}"),
+)
+
+# Page margins: top/bottom and left/right
+_MARGIN_TB = Inches(0.5)
+_MARGIN_LR = Inches(0.75)
+
+
+@lru_cache(maxsize=1)
+def _template_bytes() -> bytes:
+    """Serialize a blank document with the resume margins, built once"""
+    doc = Document()
+    for section in doc.sections:
+        section.top_margin = _MARGIN_TB
+        section.bottom_margin = _MARGIN_TB
+        section.left_margin = _MARGIN_LR
+        section.right_margin = _MARGIN_LR
+
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
 
 class ResumeGeneratorInput(BaseModel):
     user_info: Dict[str, Any] = Field(
@@ -29,16 +57,8 @@ class ResumeGeneratorTool(BaseTool):
         try:
             filename = output_filename
 
-            # Create a new Document
-            doc = Document()
-
-            # Set document margins
-            sections = doc.sections
-            for section in sections:
-                section.top_margin = Inches(0.5)
-                section.bottom_margin = Inches(0.5)
-                section.left_margin = Inches(0.75)
-                section.right_margin = Inches(0.75)
+            # Start from the cached template with margins already set
+            doc = Document(io.BytesIO(_template_bytes()))
 
             # Header with name and contact info
             header = doc.add_heading(user_info.get("name", "Your Name"), 0)
@@ -46,38 +66,37 @@ class ResumeGeneratorTool(BaseTool):
 
             contact_info = doc.add_paragraph()
             contact_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            contact_text = []
-            if user_info.get("email"):
-                contact_text.append(user_info["email"])
-            if user_info.get("phone"):
-                contact_text.append(user_info["phone"])
-            if user_info.get("location"):
-                contact_text.append(user_info["location"])
-            if user_info.get("linkedin"):
-                contact_text.append(f"LinkedIn: {user_info['linkedin']}")
+            contact_text = [
+                fmt.format(value)
+                for key, fmt in _CONTACT_FIELDS
+                if (value := user_info.get(key))
+            ]
 
             contact_info.add_run(" | ".join(contact_text))
 
             # Professional Summary
-            doc.add_heading("Professional Summary", level=1)
             summary = user_info.get(
                 "summary",
                 "Experienced professional with expertise in relevant technologies and strong problem-solving skills.",
             )
-            doc.add_paragraph(summary)
+            if summary:
+                doc.add_heading("Professional Summary", level=1)
+                doc.add_paragraph(summary)
 
             # Skills Section
-            doc.add_heading("Technical Skills", level=1)
             skills = user_info.get("skills", [])
-            if isinstance(skills, list):
-                skills_text = ", ".join(skills)
-            else:
-                skills_text = str(skills)
-            doc.add_paragraph(skills_text)
+            if skills:
+                doc.add_heading("Technical Skills", level=1)
+                if isinstance(skills, list):
+                    skills_text = ", ".join(skills)
+                else:
+                    skills_text = str(skills)
+                doc.add_paragraph(skills_text)
 
             # Experience Section
-            doc.add_heading("Professional Experience", level=1)
-            experiences = user_info.get("experience", [])
+            # Empty values (None, "", []) skip the section; only other non-list
+            # values fall back to a placeholder entry
+            experiences = user_info.get("experience") or []
             if not isinstance(experiences, list):
                 experiences = [
                     {
@@ -88,18 +107,19 @@ class ResumeGeneratorTool(BaseTool):
                     }
                 ]
 
-            for exp in experiences:
-                exp_para = doc.add_paragraph()
-                exp_para.add_run(
-                    f"{exp.get('title', 'Position Title')} - {exp.get('company', 'Company Name')}"
-                ).bold = True
-                exp_para.add_run(f"\n{exp.get('duration', 'Duration')}")
-                if exp.get("description"):
-                    doc.add_paragraph(f"• {exp['description']}")
+            if experiences:
+                doc.add_heading("Professional Experience", level=1)
+                for exp in experiences:
+                    exp_para = doc.add_paragraph()
+                    exp_para.add_run(
+                        f"{exp.get('title', 'Position Title')} - {exp.get('company', 'Company Name')}"
+                    ).bold = True
+                    exp_para.add_run(f"\n{exp.get('duration', 'Duration')}")
+                    if exp.get("description"):
+                        exp_para.add_run(f"\n• {exp['description']}")
 
             # Education Section
-            doc.add_heading("Education", level=1)
-            education = user_info.get("education", [])
+            education = user_info.get("education") or []
             if not isinstance(education, list):
                 education = [
                     {
@@ -109,24 +129,25 @@ class ResumeGeneratorTool(BaseTool):
                     }
                 ]
 
-            for edu in education:
-                edu_para = doc.add_paragraph()
-                edu_para.add_run(
-                    f"{edu.get('degree', 'Degree')} - {edu.get('school', 'School Name')}"
-                ).bold = True
-                if edu.get("year"):
-                    edu_para.add_run(f" ({edu['year']})")
+            if education:
+                doc.add_heading("Education", level=1)
+                for edu in education:
+                    edu_para = doc.add_paragraph()
+                    edu_para.add_run(
+                        f"{edu.get('degree', 'Degree')} - {edu.get('school', 'School Name')}"
+                    ).bold = True
+                    if edu.get("year"):
+                        edu_para.add_run(f" ({edu['year']})")
 
             # Certifications (if any)
             certifications = user_info.get("certifications", [])
             if certifications:
                 doc.add_heading("Certifications", level=1)
-                for cert in certifications:
-                    doc.add_paragraph(f"• {cert}")
+                # One paragraph with line breaks rather than one per entry
+                doc.add_paragraph("\n".join(f"• {cert}" for cert in certifications))
 
-            # Save the document
-            output_path = os.path.join(os.getcwd(), filename)
-            doc.save(output_path)
+            # Save the document (relative paths resolve against the cwd)
+            doc.save(filename)
 
             return f"Resume successfully generated and saved as '{filename}' in the current directory. The resume has been tailored based on the job requirements analysis."
 